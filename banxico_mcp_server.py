@@ -10,24 +10,22 @@ License: MIT
 Repository: https://github.com/yourusername/banxico-mcp-server
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Final, NamedTuple, Optional
+from datetime import date, timedelta
+import anyio
+import asyncio
 import httpx
 import logging
+import orjson
 import os
 import signal
+import time
 
-# MCP and FastMCP imports
-try:
-    from fastmcp import FastMCP
-except ImportError:
-    print("Installing required dependencies...")
-    import subprocess
-    import sys
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "fastmcp", "httpx"])
-    from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
 
-# Initialize FastMCP server
-mcp = FastMCP("banxico")
+# MCP and FastMCP imports
+from fastmcp import FastMCP
 
 # Constants
 BANXICO_API_BASE = "https://www.banxico.org.mx/SieAPIRest/service/v1"
@@ -35,6 +33,36 @@ USER_AGENT = "banxico-mcp/1.0"
 
 # Get API token from environment variable
 BANXICO_TOKEN = os.getenv("BANXICO_API_TOKEN")
+_TOKEN_ERROR: Final = "Error: BANXICO_API_TOKEN environment variable not set. Please configure your API token."
+
+# Inflation types mapped to their series IDs
+INFLATION_SERIES: Final[dict[str, str]] = {
+    "monthly": "SP30577",      # Monthly Inflation
+    "accumulated": "SP30579",  # Accumulated Inflation
+    "annual": "SP30578",       # Annual Inflation
+}
+
+# Response cache TTLs in seconds. Banxico publishes most series at most once
+# a day, so repeated tool calls can be answered from memory.
+CACHE_TTL_LATEST = 300        # series/{id}/datos/oportuno
+CACHE_TTL_HISTORICAL = 3600   # series/{id}/datos[/{start}/{end}]
+CACHE_TTL_METADATA = 86400    # series/{id}
+CACHE_MAX_ENTRIES = 256
+# Upper bound on the raw JSON bytes held by the cache; parsed payloads take
+# several times this in memory, so a single full-history response cannot
+# crowd out everything else
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# The SIE API accepts up to 20 comma-separated series IDs per request
+MAX_SERIES_PER_REQUEST = 20
+
+# Approximate calendar days between observations, used to request only the
+# recent window of a series instead of its full history
+DAYS_PER_POINT = {"daily": 1.5, "weekly": 7.5, "monthly": 31}
+# Extra days added to each window to absorb publication lag and holidays
+RANGE_PADDING_DAYS = 60
+# Windows reaching back past this date fall back to the full series
+RANGE_FLOOR = date(1900, 1, 1)
 
 # Get port from environment
 MCP_PORT = int(os.getenv("MCP_PORT", "8000"))
@@ -43,6 +71,94 @@ MCP_PORT = int(os.getenv("MCP_PORT", "8000"))
 logging.basicConfig(level=logging.INFO, handlers=[logging.StreamHandler()])
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client, created lazily so connections to Banxico are pooled
+# and reused across tool calls instead of re-handshaking on every request.
+# HTTP/2 lets concurrent requests multiplex over a single connection.
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP client for the Banxico API.
+    
+    Returns:
+        A pooled httpx.AsyncClient bound to the Banxico base URL
+    """
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            base_url=BANXICO_API_BASE,
+            headers={"User-Agent": USER_AGENT},
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=40,
+                keepalive_expiry=60,
+            ),
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client, releasing pooled connections."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+class CacheEntry(NamedTuple):
+    """A cached Banxico response and the validators used to revalidate it."""
+    fetched_at: float
+    etag: str | None
+    last_modified: str | None
+    size: int  # Raw response size in bytes
+    payload: dict[str, Any]
+
+
+# Cached responses keyed by endpoint, and their total size in bytes
+_CACHE: dict[str, CacheEntry] = {}
+_CACHE_BYTES = 0
+# Per-endpoint locks so concurrent misses trigger a single upstream request,
+# with the number of callers using each; a lock is dropped once unused
+_CACHE_LOCKS: dict[str, asyncio.Lock] = {}
+_CACHE_LOCK_USERS: dict[str, int] = {}
+
+
+def _cache_ttl(endpoint: str) -> int:
+    """Return the cache TTL for an endpoint based on the kind of data it serves."""
+    if endpoint.endswith("/datos/oportuno"):
+        return CACHE_TTL_LATEST
+    if "/datos" in endpoint:
+        return CACHE_TTL_HISTORICAL
+    return CACHE_TTL_METADATA
+
+
+def _is_fresh(endpoint: str, entry: CacheEntry) -> bool:
+    """Return whether a cache entry for an endpoint has not expired."""
+    return time.monotonic() - entry.fetched_at < _cache_ttl(endpoint)
+
+
+def _cache_put(endpoint: str, entry: CacheEntry) -> None:
+    """Store an entry, evicting the oldest entries once the cache is full."""
+    global _CACHE_BYTES
+    old = _CACHE.pop(endpoint, None)
+    if old is not None:
+        _CACHE_BYTES -= old.size
+    if entry.size > CACHE_MAX_BYTES:
+        # Too large to cache without evicting everything else
+        return
+    _CACHE[endpoint] = entry
+    _CACHE_BYTES += entry.size
+    while len(_CACHE) > CACHE_MAX_ENTRIES or _CACHE_BYTES > CACHE_MAX_BYTES:
+        oldest = next(iter(_CACHE))
+        _CACHE_BYTES -= _CACHE.pop(oldest).size
+
+
+# Initialize FastMCP server
+mcp = FastMCP("banxico")
+
 
 # Health check endpoint for container orchestration
 @mcp.tool()
@@ -55,9 +171,19 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@mcp.custom_route("/health", methods=["GET"])
+async def health_route(request: Request) -> JSONResponse:
+    """HTTP health endpoint used by Docker and orchestrator probes."""
+    return JSONResponse({"status": "healthy"})
+
+
 async def make_banxico_request(endpoint: str, token: str) -> dict[str, Any] | None:
     """
-    Make a request to the Banxico SIE API with proper error handling.
+    Make a request to the Banxico SIE API, serving fresh responses from cache.
+    
+    Expired entries are revalidated with a conditional GET, so unchanged
+    series are confirmed with a bodiless 304 instead of being downloaded again.
+    The returned payload may be shared with the cache and must not be mutated.
     
     Args:
         endpoint: The API endpoint to call (without base URL)
@@ -66,272 +192,260 @@ async def make_banxico_request(endpoint: str, token: str) -> dict[str, Any] | No
     Returns:
         JSON response data or None if request failed
     """
-    url = f"{BANXICO_API_BASE}/{endpoint}"
-    headers = {"User-Agent": USER_AGENT}
+    entry = _CACHE.get(endpoint)
+    if entry is not None and _is_fresh(endpoint, entry):
+        return entry.payload
+    
+    lock = _CACHE_LOCKS.setdefault(endpoint, asyncio.Lock())
+    _CACHE_LOCK_USERS[endpoint] = _CACHE_LOCK_USERS.get(endpoint, 0) + 1
+    try:
+        async with lock:
+            # Another caller may have refreshed the cache while we waited
+            entry = _CACHE.get(endpoint)
+            if entry is not None and _is_fresh(endpoint, entry):
+                return entry.payload
+            
+            entry = await fetch_banxico(endpoint, token, entry)
+            if entry is None:
+                return None
+            _cache_put(endpoint, entry)
+            return entry.payload
+    finally:
+        # Drop the lock once no caller needs it, so failed or uncached
+        # endpoints do not accumulate locks
+        _CACHE_LOCK_USERS[endpoint] -= 1
+        if not _CACHE_LOCK_USERS[endpoint]:
+            del _CACHE_LOCK_USERS[endpoint]
+            del _CACHE_LOCKS[endpoint]
+
+
+async def fetch_banxico(
+    endpoint: str, token: str, stale: CacheEntry | None = None
+) -> CacheEntry | None:
+    """
+    Fetch an endpoint from the Banxico SIE API with proper error handling.
+    
+    Args:
+        endpoint: The API endpoint to call (without base URL)
+        token: The Banxico API token
+        stale: Expired cache entry whose validators are sent with the request
+        
+    Returns:
+        A new cache entry (the stale one, refreshed, on 304 Not Modified)
+        or None if request failed
+    """
     params = {"token": token}
+    headers = {}
+    if stale is not None:
+        if stale.etag:
+            headers["If-None-Match"] = stale.etag
+        if stale.last_modified:
+            headers["If-Modified-Since"] = stale.last_modified
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params, timeout=30.0)
+        async with get_client().stream("GET", endpoint, params=params, headers=headers) as response:
+            if response.status_code == 304 and stale is not None:
+                return stale._replace(fetched_at=time.monotonic())
+            # Check the status before reading so error bodies are never downloaded
             response.raise_for_status()
-            return response.json()
+            content = await response.aread()
+        # Parse the raw bytes directly; orjson is much faster than stdlib json
+        # and skips decoding the payload to str first
+        return CacheEntry(
+            fetched_at=time.monotonic(),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            size=len(content),
+            payload=orjson.loads(content),
+        )
     except httpx.HTTPError as e:
-        logger.error(f"HTTP error occurred: {e}")
+        logger.error("HTTP error occurred: %s", e)
         return None
     except Exception as e:
-        logger.error(f"An error occurred: {e}")
+        logger.error("An error occurred: %s", e)
         return None
 
 
-def format_exchange_rate_data(data: dict[str, Any]) -> str:
+async def make_series_request(
+    series_id: str, token: str, limit: Optional[int], periodicity: str
+) -> dict[str, Any] | None:
     """
-    Format exchange rate data into a readable string.
+    Fetch the most recent data points of a series from the Banxico SIE API.
+    
+    Requests a date range sized from the limit and the series periodicity,
+    falling back to the full series when the window holds fewer points or
+    would reach back before RANGE_FLOOR.
     
     Args:
-        data: Raw JSON response from Banxico API
+        series_id: The series ID to fetch (or several, comma-separated)
+        token: The Banxico API token
+        limit: Number of recent data points needed (None or <= 0 for the full series)
+        periodicity: Series frequency ('daily', 'weekly' or 'monthly')
         
     Returns:
-        Formatted string with exchange rate information
+        JSON response data or None if request failed
     """
-    if not data or "bmx" not in data:
-        return "No data available"
-    
-    series_list = data["bmx"].get("series", [])
-    if not series_list:
-        return "No series data found"
-    
-    result = []
-    for series in series_list:
-        series_title = series.get("titulo", "Unknown Series")
-        series_id = series.get("idSerie", "Unknown ID")
-        result.append(f"Series: {series_title} (ID: {series_id})")
-        
-        datos = series.get("datos", [])
-        if not datos:
-            result.append("  No data points available")
-        else:
-            result.append(f"  Total data points: {len(datos)}")
-            # Show first few and last few data points
-            if len(datos) <= 10:
-                for dato in datos:
-                    fecha = dato.get("fecha", "Unknown date")
-                    valor = dato.get("dato", "N/A")
-                    result.append(f"  {fecha}: {valor}")
-            else:
-                # Show first 5
-                for i, dato in enumerate(datos[:5]):
-                    fecha = dato.get("fecha", "Unknown date")
-                    valor = dato.get("dato", "N/A")
-                    result.append(f"  {fecha}: {valor}")
-                
-                result.append(f"  ... ({len(datos) - 10} more data points) ...")
-                
-                # Show last 5
-                for dato in datos[-5:]:
-                    fecha = dato.get("fecha", "Unknown date")
-                    valor = dato.get("dato", "N/A")
-                    result.append(f"  {fecha}: {valor}")
-        
-        result.append("")  # Empty line between series
-    
-    return "\n".join(result)
-
-
-def format_inflation_data(data: dict[str, Any]) -> str:
+    if limit is not None and limit <= 0:
+        limit = None
+    today = date.today()
+    span = int(limit * DAYS_PER_POINT[periodicity]) + RANGE_PADDING_DAYS if limit else 0
+    if limit and span <= (today - RANGE_FLOOR).days:
+        start = today - timedelta(days=span)
+        # Some series (e.g. UDIS) are published ahead of time, so look past today
+        end = today + timedelta(days=RANGE_PADDING_DAYS)
+        endpoint = f"series/{series_id}/datos/{start.isoformat()}/{end.isoformat()}"
+        data = await make_banxico_request(endpoint, token)
+        if data is None:
+            return None
+        series_list = data.get("bmx", {}).get("series") or []
+        if series_list and all(len(s.get("datos") or []) >= limit for s in series_list):
+            return data
+    
+    return await make_banxico_request(f"series/{series_id}/datos", token)
+
+
+# Leading characters of values that may parse as numbers; lets the
+# formatters skip float() and its exception for markers such as "N/E"
+_NUMERIC_START = frozenset("0123456789+-.")
+
+
+def _fmt_pct(valor: Any) -> Any:
+    """Append a percentage symbol to numeric values, leaving markers like "N/E" as-is."""
+    if isinstance(valor, str) and valor[:1] in _NUMERIC_START:
+        try:
+            return f"{float(valor)}%"
+        except ValueError:
+            pass
+    return valor
+
+
+def _fmt_money(valor: Any) -> Any:
+    """Format numeric values, adding thousands separators to large amounts."""
+    if isinstance(valor, str) and valor[:1] in _NUMERIC_START:
+        try:
+            valor_num = float(valor)
+        except ValueError:
+            return valor
+        return f"{valor_num:,.2f}" if valor_num >= 1000 else f"{valor_num}"
+    return valor
+
+
+class FormatSpec(NamedTuple):
+    """How a family of Banxico series is rendered by _format."""
+    no_data: str                     # Message when the response is empty
+    no_series: str                   # Message when the response has no series
+    prefix: str                      # Prepended to each series header
+    head: int                        # Leading points shown before an ellipsis (0 = none)
+    tail: int                        # Trailing points shown
+    value_fn: Callable[[Any], Any]   # Formats each raw "dato" value
+    show_unit: bool                  # Whether to print the series unit
+
+
+_EXCHANGE = FormatSpec(
+    "No data available", "No series data found", "Series: ", 5, 5, str, False
+)
+_INFLATION = FormatSpec(
+    "No inflation data available", "No inflation series found", "📊 ", 0, 10, _fmt_pct, False
+)
+_INTEREST_RATE = FormatSpec(
+    "No interest rate data available", "No interest rate series found", "📈 ", 0, 10, _fmt_pct, False
+)
+_FINANCIAL = FormatSpec(
+    "No financial data available", "No financial series found", "💰 ", 0, 10, _fmt_money, True
+)
+# Show more points for unemployment trends
+_UNEMPLOYMENT = FormatSpec(
+    "No unemployment data available", "No unemployment series found", "👥 ", 0, 12, _fmt_pct, True
+)
+
+
+def _format(data: dict[str, Any], spec: FormatSpec, limit: Optional[int] = None) -> str:
     """
-    Format inflation data with percentage symbols and better labeling.
+    Format a Banxico series response according to a FormatSpec.
+    
+    The response is never modified, so cached payloads can be passed directly.
     
     Args:
         data: Raw JSON response from Banxico API
+        spec: Rendering options for this kind of series
+        limit: Only consider the most recent `limit` points of each series
+            (None or a value <= 0 considers all of them)
         
     Returns:
-        Formatted string with inflation data including percentage symbols
+        Formatted string with one block per series
     """
     if not data or "bmx" not in data:
-        return "No inflation data available"
+        return spec.no_data
     
     series_list = data["bmx"].get("series", [])
     if not series_list:
-        return "No inflation series found"
-    
-    result = []
+        return spec.no_series
+    
+    # Read the spec once rather than on every series
+    prefix = spec.prefix
+    head = spec.head
+    tail = spec.tail
+    value_fn = spec.value_fn
+    show_unit = spec.show_unit
+    result: list[str] = []
     for series in series_list:
         title = series.get("titulo", "Unknown Series")
         series_id = series.get("idSerie", "Unknown ID")
-        result.append(f"📊 {title} (ID: {series_id})")
+        result.append(f"{prefix}{title} (ID: {series_id})")
+        if show_unit:
+            unit = series.get("unidad", "")
+            if unit:
+                result.append(f"  Unit: {unit}")
         
-        datos = series.get("datos", [])
+        datos: list[dict[str, str]] = series.get("datos", [])
         if not datos:
             result.append("  No data points available")
         else:
-            result.append(f"  Total data points: {len(datos)}")
-            # Show recent data points with percentage formatting
-            display_count = min(len(datos), 10)
-            for dato in datos[-display_count:]:
-                fecha = dato.get("fecha", "Unknown date")
-                valor = dato.get("dato", "N/A")
-                # Add percentage symbol for inflation data
-                if valor != "N/A" and valor is not None:
-                    try:
-                        valor_num = float(valor)
-                        valor = f"{valor_num}%"
-                    except (ValueError, TypeError):
-                        pass
-                result.append(f"  {fecha}: {valor}")
+            total = len(datos)
+            # Limits of zero or less mean "no limit"
+            if limit is not None and 0 < limit < total:
+                datos = datos[-limit:]
+                total = limit
+            result.append(f"  Total data points: {total}")
+            if not head:
+                # Show only the most recent data points
+                result.extend(f"  {d['fecha']}: {value_fn(d['dato'])}" for d in datos[-tail:])
+            elif total <= head + tail:
+                result.extend(f"  {d['fecha']}: {value_fn(d['dato'])}" for d in datos)
+            else:
+                # Show first few and last few data points
+                result.extend(f"  {d['fecha']}: {value_fn(d['dato'])}" for d in datos[:head])
+                result.append(f"  ... ({total - head - tail} more data points) ...")
+                result.extend(f"  {d['fecha']}: {value_fn(d['dato'])}" for d in datos[-tail:])
         
         result.append("")  # Empty line between series
     
     return "\n".join(result)
 
 
-def format_interest_rate_data(data: dict[str, Any]) -> str:
-    """
-    Format interest rate data with percentage symbols and rate-specific formatting.
-    
-    Args:
-        data: Raw JSON response from Banxico API
-        
-    Returns:
-        Formatted string with interest rate data
-    """
-    if not data or "bmx" not in data:
-        return "No interest rate data available"
-    
-    series_list = data["bmx"].get("series", [])
-    if not series_list:
-        return "No interest rate series found"
-    
-    result = []
-    for series in series_list:
-        title = series.get("titulo", "Unknown Series")
-        series_id = series.get("idSerie", "Unknown ID")
-        result.append(f"📈 {title} (ID: {series_id})")
-        
-        datos = series.get("datos", [])
-        if not datos:
-            result.append("  No data points available")
-        else:
-            result.append(f"  Total data points: {len(datos)}")
-            # Show recent data points with percentage formatting
-            display_count = min(len(datos), 10)
-            for dato in datos[-display_count:]:
-                fecha = dato.get("fecha", "Unknown date")
-                valor = dato.get("dato", "N/A")
-                # Add percentage symbol for interest rate data
-                if valor != "N/A" and valor is not None:
-                    try:
-                        valor_num = float(valor)
-                        valor = f"{valor_num}%"
-                    except (ValueError, TypeError):
-                        pass
-                result.append(f"  {fecha}: {valor}")
-        
-        result.append("")  # Empty line between series
-    
-    return "\n".join(result)
+def format_exchange_rate_data(data: dict[str, Any], limit: Optional[int] = None) -> str:
+    """Format exchange rate data, showing the first and last few data points."""
+    return _format(data, _EXCHANGE, limit)
 
 
-def format_financial_data(data: dict[str, Any]) -> str:
-    """
-    Format financial data with appropriate units and formatting.
-    
-    Args:
-        data: Raw JSON response from Banxico API
-        
-    Returns:
-        Formatted string with financial data
-    """
-    if not data or "bmx" not in data:
-        return "No financial data available"
-    
-    series_list = data["bmx"].get("series", [])
-    if not series_list:
-        return "No financial series found"
-    
-    result = []
-    for series in series_list:
-        title = series.get("titulo", "Unknown Series")
-        series_id = series.get("idSerie", "Unknown ID")
-        unit = series.get("unidad", "")
-        result.append(f"💰 {title} (ID: {series_id})")
-        if unit:
-            result.append(f"  Unit: {unit}")
-        
-        datos = series.get("datos", [])
-        if not datos:
-            result.append("  No data points available")
-        else:
-            result.append(f"  Total data points: {len(datos)}")
-            # Show recent data points with number formatting
-            display_count = min(len(datos), 10)
-            for dato in datos[-display_count:]:
-                fecha = dato.get("fecha", "Unknown date")
-                valor = dato.get("dato", "N/A")
-                # Format large numbers with commas
-                if valor != "N/A" and valor is not None:
-                    try:
-                        valor_num = float(valor)
-                        if valor_num >= 1000:
-                            valor = f"{valor_num:,.2f}"
-                        else:
-                            valor = f"{valor_num}"
-                    except (ValueError, TypeError):
-                        pass
-                result.append(f"  {fecha}: {valor}")
-        
-        result.append("")  # Empty line between series
-    
-    return "\n".join(result)
+def format_inflation_data(data: dict[str, Any], limit: Optional[int] = None) -> str:
+    """Format inflation data with percentage symbols."""
+    return _format(data, _INFLATION, limit)
 
 
-def format_unemployment_data(data: dict[str, Any]) -> str:
-    """
-    Format unemployment data with percentage symbols and labor market formatting.
-    
-    Args:
-        data: Raw JSON response from Banxico API
-        
-    Returns:
-        Formatted string with unemployment rate data
-    """
-    if not data or "bmx" not in data:
-        return "No unemployment data available"
-    
-    series_list = data["bmx"].get("series", [])
-    if not series_list:
-        return "No unemployment series found"
-    
-    result = []
-    for series in series_list:
-        title = series.get("titulo", "Unknown Series")
-        series_id = series.get("idSerie", "Unknown ID")
-        unit = series.get("unidad", "")
-        result.append(f"👥 {title} (ID: {series_id})")
-        if unit:
-            result.append(f"  Unit: {unit}")
-        
-        datos = series.get("datos", [])
-        if not datos:
-            result.append("  No data points available")
-        else:
-            result.append(f"  Total data points: {len(datos)}")
-            # Show recent data points with percentage formatting
-            display_count = min(len(datos), 12)  # Show more for unemployment trends
-            for dato in datos[-display_count:]:
-                fecha = dato.get("fecha", "Unknown date")
-                valor = dato.get("dato", "N/A")
-                # Add percentage symbol for unemployment rate
-                if valor != "N/A" and valor is not None:
-                    try:
-                        valor_num = float(valor)
-                        valor = f"{valor_num}%"
-                    except (ValueError, TypeError):
-                        pass
-                result.append(f"  {fecha}: {valor}")
-        
-        result.append("")  # Empty line between series
-    
-    return "\n".join(result)
+def format_interest_rate_data(data: dict[str, Any], limit: Optional[int] = None) -> str:
+    """Format interest rate data with percentage symbols."""
+    return _format(data, _INTEREST_RATE, limit)
+
+
+def format_financial_data(data: dict[str, Any], limit: Optional[int] = None) -> str:
+    """Format financial data with units and thousands separators."""
+    return _format(data, _FINANCIAL, limit)
+
+
+def format_unemployment_data(data: dict[str, Any], limit: Optional[int] = None) -> str:
+    """Format unemployment rate data with units and percentage symbols."""
+    return _format(data, _UNEMPLOYMENT, limit)
 
 
 @mcp.tool()
@@ -343,7 +457,7 @@ async def get_latest_usd_mxn_rate() -> str:
         The most recent USD/MXN exchange rate with date
     """
     if not BANXICO_TOKEN:
-        return "Error: BANXICO_API_TOKEN environment variable not set. Please configure your API token."
+        return _TOKEN_ERROR
     
     endpoint = "series/SF63528/datos/oportuno"
     data = await make_banxico_request(endpoint, BANXICO_TOKEN)
@@ -366,22 +480,14 @@ async def get_usd_mxn_historical_data(limit: Optional[int] = 30) -> str:
         Historical USD/MXN exchange rate data
     """
     if not BANXICO_TOKEN:
-        return "Error: BANXICO_API_TOKEN environment variable not set. Please configure your API token."
+        return _TOKEN_ERROR
     
-    endpoint = "series/SF63528/datos"
-    data = await make_banxico_request(endpoint, BANXICO_TOKEN)
+    data = await make_series_request("SF63528", BANXICO_TOKEN, limit, "daily")
     
     if not data:
         return "Failed to retrieve historical exchange rate data. Please check your API token and network connection."
     
-    # If limit is specified, truncate the data
-    if limit and data.get("bmx", {}).get("series"):
-        for series in data["bmx"]["series"]:
-            if "datos" in series and len(series["datos"]) > limit:
-                # Keep the most recent data points
-                series["datos"] = series["datos"][-limit:]
-    
-    return format_exchange_rate_data(data)
+    return format_exchange_rate_data(data, limit)
 
 
 @mcp.tool()
@@ -396,7 +502,7 @@ async def get_series_metadata(series_id: str = "SF63528") -> str:
         Series metadata including title, description, and date range
     """
     if not BANXICO_TOKEN:
-        return "Error: BANXICO_API_TOKEN environment variable not set. Please configure your API token."
+        return _TOKEN_ERROR
     
     endpoint = f"series/{series_id}"
     data = await make_banxico_request(endpoint, BANXICO_TOKEN)
@@ -443,7 +549,7 @@ async def get_date_range_data(start_date: str, end_date: str, series_id: str = "
         Exchange rate data for the specified date range
     """
     if not BANXICO_TOKEN:
-        return "Error: BANXICO_API_TOKEN environment variable not set. Please configure your API token."
+        return _TOKEN_ERROR
     
     endpoint = f"series/{series_id}/datos/{start_date}/{end_date}"
     data = await make_banxico_request(endpoint, BANXICO_TOKEN)
@@ -454,6 +560,43 @@ async def get_date_range_data(start_date: str, end_date: str, series_id: str = "
     return format_exchange_rate_data(data)
 
 
+@mcp.tool()
+async def get_multi_series(series_ids: list[str], limit: Optional[int] = 30) -> str:
+    """
+    Get data for several Banxico series in a single API request.
+    
+    Args:
+        series_ids: Series IDs to fetch, e.g. ["SF63528", "SP30577", "SF282"] (max 20)
+        limit: Maximum number of recent data points per series (default: 30)
+        
+    Returns:
+        Data for each requested series
+    """
+    if not BANXICO_TOKEN:
+        return _TOKEN_ERROR
+    
+    # Drop blanks and duplicates while keeping the requested order
+    ids = list(dict.fromkeys(s.strip() for s in series_ids if s.strip()))
+    if not ids:
+        return "Error: at least one series ID is required."
+    if len(ids) > MAX_SERIES_PER_REQUEST:
+        return f"Error: at most {MAX_SERIES_PER_REQUEST} series can be requested at once (got {len(ids)})."
+    
+    # Series may have different frequencies; a monthly-sized window holds
+    # at least `limit` points for any of them
+    data = await make_series_request(",".join(ids), BANXICO_TOKEN, limit, "monthly")
+    
+    if not data:
+        return f"Failed to retrieve data for {', '.join(ids)}. Please check your API token and network connection."
+    
+    return format_exchange_rate_data(data, limit)
+
+
+def _bad_type(inflation_type: str) -> str:
+    """Return the error message for an unknown inflation type."""
+    return f"Invalid inflation type: {inflation_type}. Available types: {list(INFLATION_SERIES)}"
+
+
 @mcp.tool()
 async def get_inflation_data(inflation_type: str = "monthly", limit: Optional[int] = 12) -> str:
     """
@@ -467,32 +610,18 @@ async def get_inflation_data(inflation_type: str = "monthly", limit: Optional[in
         Formatted inflation data with percentages
     """
     if not BANXICO_TOKEN:
-        return "Error: BANXICO_API_TOKEN environment variable not set. Please configure your API token."
+        return _TOKEN_ERROR
     
-    # Map inflation types to series IDs
-    series_map = {
-        "monthly": "SP30577",      # Monthly Inflation
-        "accumulated": "SP30579",   # Accumulated Inflation  
-        "annual": "SP30578"        # Annual Inflation
-    }
+    series_id = INFLATION_SERIES.get(inflation_type)
+    if series_id is None:
+        return _bad_type(inflation_type)
     
-    if inflation_type not in series_map:
-        return f"Invalid inflation type: {inflation_type}. Available types: {list(series_map.keys())}"
-    
-    series_id = series_map[inflation_type]
-    endpoint = f"series/{series_id}/datos"
-    data = await make_banxico_request(endpoint, BANXICO_TOKEN)
+    data = await make_series_request(series_id, BANXICO_TOKEN, limit, "monthly")
     
     if not data:
         return f"Failed to retrieve {inflation_type} inflation data. Please check your API token and network connection."
     
-    # Apply limit if specified
-    if limit and data.get("bmx", {}).get("series"):
-        for series in data["bmx"]["series"]:
-            if "datos" in series and len(series["datos"]) > limit:
-                series["datos"] = series["datos"][-limit:]
-    
-    return format_inflation_data(data)
+    return format_inflation_data(data, limit)
 
 
 @mcp.tool()
@@ -507,21 +636,14 @@ async def get_udis_data(limit: Optional[int] = 30) -> str:
         Current and historical UDIS values
     """
     if not BANXICO_TOKEN:
-        return "Error: BANXICO_API_TOKEN environment variable not set. Please configure your API token."
+        return _TOKEN_ERROR
     
-    endpoint = "series/SP68257/datos"
-    data = await make_banxico_request(endpoint, BANXICO_TOKEN)
+    data = await make_series_request("SP68257", BANXICO_TOKEN, limit, "daily")
     
     if not data:
         return "Failed to retrieve UDIS data. Please check your API token and network connection."
     
-    # Apply limit if specified
-    if limit and data.get("bmx", {}).get("series"):
-        for series in data["bmx"]["series"]:
-            if "datos" in series and len(series["datos"]) > limit:
-                series["datos"] = series["datos"][-limit:]
-    
-    return format_exchange_rate_data(data)
+    return format_exchange_rate_data(data, limit)
 
 
 @mcp.tool()
@@ -536,21 +658,14 @@ async def get_cetes_28_data(limit: Optional[int] = 30) -> str:
         Current and historical CETES 28-day rates
     """
     if not BANXICO_TOKEN:
-        return "Error: BANXICO_API_TOKEN environment variable not set. Please configure your API token."
+        return _TOKEN_ERROR
     
-    endpoint = "series/SF282/datos"
-    data = await make_banxico_request(endpoint, BANXICO_TOKEN)
+    data = await make_series_request("SF282", BANXICO_TOKEN, limit, "weekly")
     
     if not data:
         return "Failed to retrieve CETES 28-day data. Please check your API token and network connection."
     
-    # Apply limit if specified
-    if limit and data.get("bmx", {}).get("series"):
-        for series in data["bmx"]["series"]:
-            if "datos" in series and len(series["datos"]) > limit:
-                series["datos"] = series["datos"][-limit:]
-    
-    return format_interest_rate_data(data)
+    return format_interest_rate_data(data, limit)
 
 
 @mcp.tool()
@@ -565,21 +680,14 @@ async def get_banxico_reserves_data(limit: Optional[int] = 30) -> str:
         Current and historical Banxico reserve assets data
     """
     if not BANXICO_TOKEN:
-        return "Error: BANXICO_API_TOKEN environment variable not set. Please configure your API token."
+        return _TOKEN_ERROR
     
-    endpoint = "series/SF308843/datos"
-    data = await make_banxico_request(endpoint, BANXICO_TOKEN)
+    data = await make_series_request("SF308843", BANXICO_TOKEN, limit, "weekly")
     
     if not data:
         return "Failed to retrieve Banxico reserve assets data. Please check your API token and network connection."
     
-    # Apply limit if specified
-    if limit and data.get("bmx", {}).get("series"):
-        for series in data["bmx"]["series"]:
-            if "datos" in series and len(series["datos"]) > limit:
-                series["datos"] = series["datos"][-limit:]
-    
-    return format_financial_data(data)
+    return format_financial_data(data, limit)
 
 
 @mcp.tool()
@@ -594,42 +702,104 @@ async def get_unemployment_data(limit: Optional[int] = 24) -> str:
         Current and historical unemployment rate data
     """
     if not BANXICO_TOKEN:
-        return "Error: BANXICO_API_TOKEN environment variable not set. Please configure your API token."
+        return _TOKEN_ERROR
     
-    endpoint = "series/SL1/datos"
-    data = await make_banxico_request(endpoint, BANXICO_TOKEN)
+    data = await make_series_request("SL1", BANXICO_TOKEN, limit, "monthly")
     
     if not data:
         return "Failed to retrieve unemployment data. Please check your API token and network connection."
     
-    # Apply limit if specified
-    if limit and data.get("bmx", {}).get("series"):
-        for series in data["bmx"]["series"]:
-            if "datos" in series and len(series["datos"]) > limit:
-                series["datos"] = series["datos"][-limit:]
-    
-    return format_unemployment_data(data)
+    return format_unemployment_data(data, limit)
 
 
-# Graceful shutdown handler
-def signal_handler(sig, frame):
-    """Handle shutdown signals gracefully."""
-    logger.info("Shutdown signal received, exiting...")
-    exit(0)
+# Indicators shown by get_economic_snapshot: (name, endpoint, formatter)
+SNAPSHOT_SECTIONS: Final[tuple[tuple[str, str, Callable[[dict[str, Any]], str]], ...]] = (
+    ("USD/MXN exchange rate", "series/SF63528/datos/oportuno", format_exchange_rate_data),
+    ("annual inflation", "series/SP30578/datos/oportuno", format_inflation_data),
+    ("CETES 28-day", "series/SF282/datos/oportuno", format_interest_rate_data),
+    ("unemployment", "series/SL1/datos/oportuno", format_unemployment_data),
+)
 
-signal.signal(signal.SIGTERM, signal_handler)
-signal.signal(signal.SIGINT, signal_handler)
 
+@mcp.tool()
+async def get_economic_snapshot() -> str:
+    """
+    Get the latest values of Mexico's key economic indicators in one call.
+    
+    Fetches the USD/MXN exchange rate, annual inflation, CETES 28-day rate
+    and unemployment rate concurrently.
+        
+    Returns:
+        The most recent value of each indicator
+    """
+    if not BANXICO_TOKEN:
+        return _TOKEN_ERROR
+    
+    responses = await asyncio.gather(
+        *(make_banxico_request(endpoint, BANXICO_TOKEN) for _, endpoint, _ in SNAPSHOT_SECTIONS)
+    )
+    
+    result = []
+    for (name, _, formatter), data in zip(SNAPSHOT_SECTIONS, responses):
+        if not data:
+            result.append(f"Failed to retrieve {name} data.\n")
+        else:
+            result.append(formatter(data))
+    
+    return "\n".join(result)
 
-if __name__ == "__main__":
-    # Run FastMCP server with HTTP transport
-    logger.info(f"Starting Banxico MCP server on 0.0.0.0:{MCP_PORT}")
-    mcp.run(transport="http", host="0.0.0.0", port=MCP_PORT)
+
+async def serve() -> None:
+    """Run the HTTP server, shutting down cleanly on SIGTERM/SIGINT."""
+    loop = asyncio.get_running_loop()
+    server = asyncio.create_task(
+        mcp.run_async(transport="http", host="0.0.0.0", port=MCP_PORT)
+    )
+    loop_handlers: dict[int, Any] = {}
+    stopping = False
+    
+    def request_shutdown(sig: int) -> None:
+        nonlocal stopping
+        if stopping:
+            return
+        stopping = True
+        # While serving, uvicorn installs its own handlers and shuts down
+        # gracefully on its own; only stop the server ourselves otherwise
+        if signal.getsignal(sig) is loop_handlers[sig]:
+            logger.info("Shutdown signal received, exiting...")
+            server.cancel()
+    
+    # Handle signals on the event loop instead of exiting from a signal.signal
+    # handler, so the shared HTTP client is always closed before exit
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, request_shutdown, sig)
+        except NotImplementedError:
+            # Signal handlers are not supported by Windows event loops
+            continue
+        loop_handlers[sig] = signal.getsignal(sig)
+    
+    try:
+        await server
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await close_client()
 
 
 def main():
     """Entry point for package installation."""
-    logger.info(f"Starting Banxico MCP server on 0.0.0.0:{MCP_PORT}")
-    mcp.run(transport="http", host="0.0.0.0", port=MCP_PORT)
+    # Run on uvloop when installed; uvicorn picks httptools automatically
+    try:
+        import uvloop  # noqa: F401
+        backend_options = {"use_uvloop": True}
+    except ImportError:
+        backend_options = {}
+    
+    logger.info("Starting Banxico MCP server on 0.0.0.0:%s", MCP_PORT)
+    anyio.run(serve, backend_options=backend_options)
 
 
+if __name__ == "__main__":
+    # Run FastMCP server with HTTP transport
+    main()
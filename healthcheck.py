@@ -1,28 +1,37 @@
 #!/usr/bin/env python3
 """Health check script for Banxico MCP Server."""
 
-import socket
 import os
 import sys
 
+import httpx
+
 def check_health():
-    """Check if server is listening on the configured port."""
+    """Check that the server answers its HTTP /health endpoint."""
     port = int(os.getenv("MCP_PORT", "8000"))
     
     try:
-        # Try to connect to localhost on the configured port
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(5)
-            result = sock.connect_ex(("127.0.0.1", port))
-            if result == 0:
-                print(f"✓ Server is listening on port {port}")
-                return 0
-            else:
-                print(f"✗ Server is NOT listening on port {port}")
-                return 1
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=2.0) as client:
+            response = client.get("/health")
     except Exception as e:
+        # Refused connections, timeouts and protocol errors all mean the
+        # server is not serving requests
         print(f"✗ Health check failed: {e}")
         return 1
+    
+    if response.status_code == 404:
+        # Older servers without the /health route still answered over HTTP
+        print(f"✓ Server is answering HTTP on port {port} (no /health endpoint)")
+        return 0
+    try:
+        healthy = response.status_code == 200 and response.json().get("status") == "healthy"
+    except ValueError:
+        healthy = False
+    if healthy:
+        print(f"✓ Server is healthy on port {port}")
+        return 0
+    print(f"✗ Server is unhealthy on port {port} (HTTP {response.status_code})")
+    return 1
 
 if __name__ == "__main__":
     sys.exit(check_health())